@@ -4,7 +4,7 @@
 
 import abc
 import os
-from typing import Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
 
 from ._common import PathType, Platform, PlatformType, normalize_platform, unprintable_ascii_chars
 from .error import ReservedNameError, ValidationError
@@ -105,6 +105,8 @@ class BaseFile:
 
 
 class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
+    __reserved_keyword_set: Optional[FrozenSet[str]] = None
+
     @abc.abstractmethod
     def validate(self, value: PathType) -> None:  # pragma: no cover
         pass
@@ -118,7 +120,12 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
         return True
 
     def _is_reserved_keyword(self, value: str) -> bool:
-        return value in self.reserved_keywords
+        if self.__reserved_keyword_set is None:
+            self.__reserved_keyword_set = frozenset(
+                keyword.upper() for keyword in self.reserved_keywords
+            )
+
+        return value in self.__reserved_keyword_set
 
 
 class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
@@ -8,7 +8,7 @@ import re
 import string
 import warnings
 from pathlib import Path
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Iterable, List, Optional, Union, cast
 
 
 _re_whitespaces = re.compile(r"^[\s]+$")
@@ -108,8 +108,16 @@ def _get_ascii_symbols() -> List[str]:
 
 ascii_symbols = tuple(_get_ascii_symbols())
 
+# '[', '&', '~', '|' are escaped to avoid FutureWarning of possible nested set operations
+_CHAR_CLASS_SPECIAL_CHARS = frozenset("\\]^-[&~|")
+
+
+def escape_char_class(chars: Iterable[str]) -> str:
+    return "".join("\\" + c if c in _CHAR_CLASS_SPECIAL_CHARS else c for c in chars)
+
+
 __RE_UNPRINTABLE_CHARS = re.compile(
-    "[{}]".format(re.escape("".join(unprintable_ascii_chars))), re.UNICODE
+    "[{}]".format(escape_char_class(unprintable_ascii_chars)), re.UNICODE
 )
 __RE_ANSI_ESCAPE = re.compile(
     r"(?:\x1B[@-Z\\-_]|[\x80-\x9A\x9C-\x9F]|(?:\x1B\[|\x9B)[0-?]*[ -/]*[@-~])"
@@ -6,6 +6,7 @@ import itertools
 import ntpath
 import posixpath
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Pattern, Tuple
 
@@ -16,6 +17,7 @@ from ._common import (
     PlatformType,
     findall_to_str,
     is_pathlike_obj,
+    normalize_platform,
     preprocess,
     validate_pathtype,
 )
@@ -71,8 +73,8 @@ class FileNameSanitizer(AbstractSanitizer):
             self.__validator.validate(sanitized_filename)
         except ValidationError as e:
             if e.reason == ErrorReason.RESERVED_NAME and e.reusable_name is False:
-                sanitized_filename = re.sub(
-                    re.escape(e.reserved_name), f"{e.reserved_name}_", sanitized_filename
+                sanitized_filename = sanitized_filename.replace(
+                    e.reserved_name, f"{e.reserved_name}_"
                 )
             elif e.reason == ErrorReason.INVALID_CHARACTER:
                 if self.platform in [Platform.UNIVERSAL, Platform.WINDOWS]:
@@ -137,13 +139,15 @@ class FileNameValidator(BaseValidator):
             platform=platform,
         )
 
+        if self._is_universal() or self._is_windows():
+            self.__allow_whitespaces = False
+            self.__validate_chars = self.__validate_win_filename
+        else:
+            self.__allow_whitespaces = True
+            self.__validate_chars = self.__validate_unix_filename
+
     def validate(self, value: PathType) -> None:
-        validate_pathtype(
-            value,
-            allow_whitespaces=False
-            if self.platform in [Platform.UNIVERSAL, Platform.WINDOWS]
-            else True,
-        )
+        validate_pathtype(value, allow_whitespaces=self.__allow_whitespaces)
 
         unicode_filename = preprocess(value)
         value_len = len(unicode_filename)
@@ -160,11 +164,7 @@ class FileNameValidator(BaseValidator):
             )
 
         self._validate_reserved_keywords(unicode_filename)
-
-        if self._is_universal() or self._is_windows():
-            self.__validate_win_filename(unicode_filename)
-        else:
-            self.__validate_unix_filename(unicode_filename)
+        self.__validate_chars(unicode_filename)
 
     def validate_abspath(self, value: str) -> None:
         err = ValidationError(
@@ -205,7 +205,7 @@ class FileNameValidator(BaseValidator):
         if unicode_filename[-1] in (" ", "."):
             raise InvalidCharError(
                 self._ERROR_MSG_TEMPLATE.format(
-                    invalid=re.escape(unicode_filename[-1]), value=repr(unicode_filename)
+                    invalid=repr(unicode_filename[-1]), value=repr(unicode_filename)
                 ),
                 platform=Platform.WINDOWS,
                 description="Do not end a file or directory name with a space or a period",
@@ -214,13 +214,29 @@ class FileNameValidator(BaseValidator):
         if unicode_filename[0] in (" "):
             raise InvalidCharError(
                 self._ERROR_MSG_TEMPLATE.format(
-                    invalid=re.escape(unicode_filename[0]), value=repr(unicode_filename)
+                    invalid=repr(unicode_filename[0]), value=repr(unicode_filename)
                 ),
                 platform=Platform.WINDOWS,
                 description="Do not start a file or directory name with a space",
             )
 
 
+@lru_cache(maxsize=128)
+def _get_filename_validator(
+    platform: Platform, min_len: int, max_len: int, check_reserved: bool
+) -> FileNameValidator:
+    return FileNameValidator(
+        platform=platform, min_len=min_len, max_len=max_len, check_reserved=check_reserved
+    )
+
+
+@lru_cache(maxsize=128)
+def _get_filename_sanitizer(
+    platform: Platform, max_len: int, check_reserved: bool
+) -> FileNameSanitizer:
+    return FileNameSanitizer(platform=platform, max_len=max_len, check_reserved=check_reserved)
+
+
 def validate_filename(
     filename: PathType,
     platform: Optional[str] = None,
@@ -273,8 +289,11 @@ def validate_filename(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FileNameValidator(
-        platform=platform, min_len=min_len, max_len=max_len, check_reserved=check_reserved
+    _get_filename_validator(
+        platform=normalize_platform(platform),
+        min_len=min_len,
+        max_len=max_len,
+        check_reserved=check_reserved,
     ).validate(filename)
 
 
@@ -298,8 +317,8 @@ def is_valid_filename(
         :py:func:`.validate_filename()`
     """
 
-    return FileNameValidator(
-        platform=platform,
+    return _get_filename_validator(
+        platform=normalize_platform(platform),
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
         check_reserved=check_reserved,
@@ -359,9 +378,19 @@ def sanitize_filename(
         :ref:`example-sanitize-filename`
     """
 
-    return FileNameSanitizer(
-        platform=platform,
-        max_len=-1 if max_len is None else max_len,
-        check_reserved=check_reserved,
-        null_value_handler=null_value_handler,
-    ).sanitize(filename, replacement_text)
+    if null_value_handler is None:
+        # user-supplied handlers may be unhashable, only the default configuration is cached
+        sanitizer = _get_filename_sanitizer(
+            platform=normalize_platform(platform),
+            max_len=-1 if max_len is None else max_len,
+            check_reserved=check_reserved,
+        )
+    else:
+        sanitizer = FileNameSanitizer(
+            platform=platform,
+            max_len=-1 if max_len is None else max_len,
+            check_reserved=check_reserved,
+            null_value_handler=null_value_handler,
+        )
+
+    return sanitizer.sanitize(filename, replacement_text)
@@ -4,18 +4,30 @@
 
 import re
 import warnings
-from typing import Sequence
+from functools import lru_cache
+from typing import FrozenSet, Pattern, Sequence
 
-from ._common import ascii_symbols, preprocess, unprintable_ascii_chars
+from ._common import ascii_symbols, escape_char_class, preprocess, unprintable_ascii_chars
 from .error import InvalidCharError
 
 
-__RE_UNPRINTABLE = re.compile(
-    "[{}]".format(re.escape("".join(unprintable_ascii_chars))), re.UNICODE
-)
+__RE_UNPRINTABLE = re.compile("[{}]".format(escape_char_class(unprintable_ascii_chars)), re.UNICODE)
 __RE_SYMBOL = re.compile(
-    "[{}]".format(re.escape("".join(ascii_symbols + unprintable_ascii_chars))), re.UNICODE
+    "[{}]".format(escape_char_class(ascii_symbols + unprintable_ascii_chars)), re.UNICODE
 )
+__SYMBOL_CHARS = frozenset(ascii_symbols + unprintable_ascii_chars)
+
+
+@lru_cache(maxsize=32)
+def __get_symbol_regexp(exclude_symbols: FrozenSet[str]) -> Pattern[str]:
+    return re.compile(
+        "[{}]".format(escape_char_class(sorted(__SYMBOL_CHARS - exclude_symbols))), re.UNICODE
+    )
+
+
+@lru_cache(maxsize=32)
+def __get_consecutive_regexp(replacement_text: str) -> Pattern[str]:
+    return re.compile(f"{re.escape(replacement_text)}+")
 
 
 def validate_unprintable(text: str) -> None:
@@ -85,28 +97,22 @@ def replace_symbol(
         :ref:`example-sanitize-symbol`
     """
 
+    text = preprocess(text)
+    if not isinstance(text, str):
+        raise TypeError("text must be a string")
+
     if exclude_symbols:
-        regexp = re.compile(
-            "[{}]".format(
-                re.escape(
-                    "".join(set(ascii_symbols + unprintable_ascii_chars) - set(exclude_symbols))
-                )
-            ),
-            re.UNICODE,
-        )
+        regexp = __get_symbol_regexp(frozenset(exclude_symbols))
     else:
         regexp = __RE_SYMBOL
 
-    try:
-        new_text = regexp.sub(replacement_text, preprocess(text))
-    except TypeError:
-        raise TypeError("text must be a string")
+    new_text = regexp.sub(replacement_text, text)
 
     if not replacement_text:
         return new_text
 
     if is_replace_consecutive_chars:
-        new_text = re.sub(f"{re.escape(replacement_text)}+", replacement_text, new_text)
+        new_text = __get_consecutive_regexp(replacement_text).sub(replacement_text, new_text)
 
     if is_strip:
         new_text = new_text.strip(replacement_text)
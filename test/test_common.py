@@ -3,6 +3,7 @@
 """
 
 import itertools
+import re
 
 import pytest
 from tcolorpy import tcolor
@@ -13,6 +14,7 @@ from pathvalidate import (
     replace_unprintable_char,
     unprintable_ascii_chars,
 )
+from pathvalidate._common import escape_char_class
 
 from ._common import alphanum_chars
 
@@ -50,3 +52,15 @@ class Test_replace_ansi_escape:
         value = "test"
         ansi_value = tcolor(value, color="ffffff", bg_color="111111", styles=["bold"])
         assert replace_ansi_escape(ansi_value) == value
+
+
+class Test_escape_char_class:
+    @pytest.mark.parametrize(
+        ["value"], [[c] for c in ascii_symbols + unprintable_ascii_chars + alphanum_chars]
+    )
+    def test_normal(self, value):
+        regexp = re.compile("[{}]".format(escape_char_class(value + "a")))
+
+        assert regexp.fullmatch(value)
+        assert regexp.fullmatch("a")
+        assert regexp.fullmatch("b" if value != "b" else "c") is None
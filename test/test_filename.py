@@ -5,7 +5,7 @@
 import platform as m_platform
 import random
 from collections import OrderedDict
-from itertools import chain, product
+from itertools import product
 from pathlib import Path
 
 import pytest
@@ -42,6 +42,8 @@ inf = float("inf")
 
 random.seed(0)
 
+PADDING_STR = randstr(64)
+
 VALID_MULTIBYTE_NAMES = ["新しいテキスト ドキュメント.txt", "新規 Microsoft Excel Worksheet.xlsx"]
 
 
@@ -109,21 +111,14 @@ class Test_validate_filename:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [
-                    args
-                    for args in product(
-                        ["{0}{1}{0}".format(randstr(64), valid_c)], VALID_PLATFORM_NAMES
-                    )
-                ]
-                for valid_c in VALID_CHARS
-            ]
-            + [
-                [args for args in product([filename], VALID_PLATFORM_NAMES)]
-                for filename in NTFS_RESERVED_FILE_NAMES
-            ]
-        ),
+        [
+            ["{0}{1}{0}".format(PADDING_STR, valid_c), platform]
+            for valid_c, platform in product(VALID_CHARS, VALID_PLATFORM_NAMES)
+        ]
+        + [
+            [filename, platform]
+            for filename, platform in product(NTFS_RESERVED_FILE_NAMES, VALID_PLATFORM_NAMES)
+        ],
     )
     def test_normal(self, value, platform):
         validate_filename(value, platform)
@@ -151,17 +146,34 @@ class Test_validate_filename:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [args for args in product([multibyte_name], VALID_PLATFORM_NAMES)]
-                for multibyte_name in VALID_MULTIBYTE_NAMES
-            ]
-        ),
+        [
+            [multibyte_name, platform]
+            for multibyte_name, platform in product(VALID_MULTIBYTE_NAMES, VALID_PLATFORM_NAMES)
+        ],
     )
     def test_normal_multibyte(self, value, platform):
         validate_filename(value, platform)
         assert is_valid_filename(value, platform=platform)
 
+    @pytest.mark.parametrize(
+        ["platform"],
+        [["win"], ["windows"], ["Windows"], [" WINDOWS "], [Platform.WINDOWS]],
+    )
+    def test_exception_platform_alias(self, platform):
+        with pytest.raises(ValidationError) as e:
+            validate_filename("a:b", platform=platform)
+        assert e.value.reason == ErrorReason.INVALID_CHARACTER
+        assert not is_valid_filename("a:b", platform=platform)
+
+    @pytest.mark.parametrize(
+        ["test_platform", "expected"],
+        [["windows", False], ["linux", True], ["windows", False]],
+    )
+    def test_normal_platform_auto(self, monkeypatch, test_platform, expected):
+        monkeypatch.setattr(m_platform, "system", lambda: test_platform)
+
+        assert is_valid_filename("a:b", platform="auto") is expected
+
     @pytest.mark.parametrize(
         ["value", "min_len", "expected"],
         [
@@ -231,17 +243,10 @@ class Test_validate_filename:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [
-                    args
-                    for args in product(
-                        ["{0}{1}{0}".format(randstr(64), invalid_c)], VALID_PLATFORM_NAMES
-                    )
-                ]
-                for invalid_c in INVALID_FILENAME_CHARS
-            ]
-        ),
+        [
+            ["{0}{1}{0}".format(PADDING_STR, invalid_c), platform]
+            for invalid_c, platform in product(INVALID_FILENAME_CHARS, VALID_PLATFORM_NAMES)
+        ],
     )
     def test_exception_invalid_char(self, value, platform):
         with pytest.raises(ValidationError) as e:
@@ -252,7 +257,7 @@ class Test_validate_filename:
     @pytest.mark.parametrize(
         ["value", "platform"],
         [
-            ["{0}{1}{0}".format(randstr(64), invalid_c), platform]
+            ["{0}{1}{0}".format(PADDING_STR, invalid_c), platform]
             for invalid_c, platform in product(
                 set(INVALID_WIN_PATH_CHARS).difference(
                     set(INVALID_PATH_CHARS + INVALID_FILENAME_CHARS + unprintable_ascii_chars)
@@ -359,6 +364,30 @@ class Test_validate_filename:
             "reason=INVALID_CHARACTER, target-platform=Windows"
         )  # noqa
 
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            [
+                "abc.",
+                r"invalid char found: invalids=('.'), value='abc.', "
+                "reason=INVALID_CHARACTER, target-platform=Windows, "
+                "description=Do not end a file or directory name with a space or a period",
+            ],
+            [
+                " abc",
+                r"invalid char found: invalids=(' '), value=' abc', "
+                "reason=INVALID_CHARACTER, target-platform=Windows, "
+                "description=Do not start a file or directory name with a space",
+            ],
+        ],
+    )
+    def test_exception_edge_char_err_msg(self, value, expected):
+        with pytest.raises(ValidationError) as e:
+            validate_filename(value, platform="windows")
+
+        assert e.value.reason == ErrorReason.INVALID_CHARACTER
+        assert str(e.value) == expected
+
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
@@ -471,6 +500,37 @@ class Test_sanitize_filename:
         with pytest.raises(ValidationError):
             sanitize_filename(value, null_value_handler=raise_error)
 
+    def test_normal_null_value_handler_after_cached_call(self):
+        assert sanitize_filename("?") == ""
+        assert sanitize_filename("?", null_value_handler=lambda e: "default") == "default"
+        assert sanitize_filename("?") == ""
+
+    def test_normal_null_value_handler_unhashable(self):
+        class UnhashableHandler:
+            __hash__ = None
+
+            def __call__(self, e):
+                return "default"
+
+        assert sanitize_filename("a:b", null_value_handler=UnhashableHandler()) == "ab"
+        assert sanitize_filename("?", null_value_handler=UnhashableHandler()) == "default"
+
+    @pytest.mark.parametrize(
+        ["platform"],
+        [["win"], ["windows"], ["Windows"], [" WINDOWS "], [Platform.WINDOWS]],
+    )
+    def test_normal_platform_alias(self, platform):
+        assert sanitize_filename("a:b ", platform=platform) == "ab"
+
+    @pytest.mark.parametrize(
+        ["test_platform", "expected"],
+        [["windows", "ab"], ["linux", "a:b"], ["windows", "ab"]],
+    )
+    def test_normal_platform_auto(self, monkeypatch, test_platform, expected):
+        monkeypatch.setattr(m_platform, "system", lambda: test_platform)
+
+        assert sanitize_filename("a:b", platform="auto") == expected
+
     @pytest.mark.parametrize(
         ["value", "replace_text", "expected"],
         [